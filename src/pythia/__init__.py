@@ -1,14 +1,38 @@
-"""pythia - pythonic deepstream."""
-
-from pythia.applications.annotation import AnnotateFramesBase
-from pythia.applications.annotation import AnnotateFramesBbox
-from pythia.applications.annotation import AnnotateFramesMaskRcnn
-from pythia.applications.base import Application
-from pythia.applications.demo import Demo
-from pythia.iterators import objects_per_batch
-from pythia.utils import Gst
+"""pythia - pythonic deepstream.
+
+The public names are imported lazily, on first access, so that
+importing a submodule (eg the cli) does not load gstreamer, deepstream
+or the applications unless they are used.
+
+"""
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any
+from typing import List
+from typing import TYPE_CHECKING
+
 from pythia.version import __version__
 
+if TYPE_CHECKING:
+    from pythia.applications.annotation import AnnotateFramesBase
+    from pythia.applications.annotation import AnnotateFramesBbox
+    from pythia.applications.annotation import AnnotateFramesMaskRcnn
+    from pythia.applications.base import Application
+    from pythia.applications.demo import Demo
+    from pythia.iterators import objects_per_batch
+    from pythia.utils import Gst
+
+_LAZY_ATTRIBUTES = {
+    "Application": "pythia.applications.base",
+    "Demo": "pythia.applications.demo",
+    "Gst": "pythia.utils",
+    "AnnotateFramesBbox": "pythia.applications.annotation",
+    "AnnotateFramesMaskRcnn": "pythia.applications.annotation",
+    "AnnotateFramesBase": "pythia.applications.annotation",
+    "objects_per_batch": "pythia.iterators",
+}
+
 __all__ = [
     "__version__",
     "Application",
@@ -19,3 +43,19 @@ __all__ = [
     "AnnotateFramesBase",
     "objects_per_batch",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
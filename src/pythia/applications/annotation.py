@@ -14,13 +14,8 @@ from typing import Literal
 from typing import Optional
 from typing import Union
 
-import pyds
-
-try:
-    import cv2
-except ImportError:
-    cv2 = None  # type: ignore[assignment]
 import numpy as np
+import pyds
 
 from pythia.applications.base import Application
 from pythia.applications.base import BoundSupportedCb
@@ -66,6 +61,7 @@ def _make_logger(
     try:
         logger = logging.getLogger(name)
         logger.setLevel(logging.DEBUG)
+        logger.propagate = False  # records are fully handled here
 
         handler = _make_handler(dst)
         handler.setLevel(logging.DEBUG)
@@ -135,19 +131,15 @@ class AnnotateFramesBase(Application, abc.ABC):
         }
         if not extract_analytics:
             return base
-        try:
-            analytics = next(iter(analytics_per_obj(detection)))
-        except StopIteration:
+        analytics = next(analytics_per_obj(detection), None)
+        if analytics is None:
             return base
         base["analytics"] = {
-            attr: getattr(analytics, attr)
-            for attr in (
-                "dirStatus",
-                "lcStatus",
-                "ocStatus",
-                "roiStatus",
-                "unique_id",
-            )
+            "dirStatus": analytics.dirStatus,
+            "lcStatus": analytics.lcStatus,
+            "ocStatus": analytics.ocStatus,
+            "roiStatus": analytics.roiStatus,
+            "unique_id": analytics.unique_id,
         }
         return base
 
@@ -303,13 +295,15 @@ class AnnotateFramesMaskRcnn(AnnotateFramesBase):
             https://docs.opencv.org/4.x/d3/dc0/group__imgproc__shape.html#gadf1ad6a0b82947fa1fe3c3d497f260e0
 
         """
-        if cv2 is None:
+        try:
+            import cv2
+        except ImportError as exc:
             raise ImportError(
                 "Unable to initialize MaskRcnn annotator."
                 " Reason: opencv-python not installed."
                 " Reinstall with 'opencv' extra,"
                 " eg 'pip install pythia[opencv]'."
-            )
+            ) from exc
         self._countour_kw = contour_kw or {}
         self._countour_kw.setdefault("mode", cv2.RETR_TREE)  # noqa: E1101
         self._countour_kw.setdefault(
@@ -336,7 +330,7 @@ class AnnotateFramesMaskRcnn(AnnotateFramesBase):
         """
 
         contours, _ = self.find_contours(mask)
-        return [[int(i) for i in c.flatten()] for c in contours]
+        return [c.flatten().tolist() for c in contours]
 
     def annotator_probe(
         self,
@@ -344,12 +338,13 @@ class AnnotateFramesMaskRcnn(AnnotateFramesBase):
         info: Gst.PadProbeInfo,
         batch_meta: pyds.NvDsBatchMeta,
     ) -> Gst.PadProbeReturn:
+        extract_analytics = self.pipeline.analytics is not None
         for frame, detection in objects_per_batch(batch_meta):
             bbox_data = self._extract_common(
                 pad,
                 frame,
                 detection,
-                extract_analytics=self.pipeline.analytics is not None,
+                extract_analytics=extract_analytics,
             )
             mask_mtx = extract_maskrcnn_mask(detection)
             mask_poly = self.generate_mask_polygon(mask_mtx)
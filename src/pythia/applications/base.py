@@ -10,15 +10,20 @@ from __future__ import annotations
 
 import inspect
 import os
+import signal
 from collections import defaultdict
+from functools import lru_cache
 from logging import getLogger
 from pathlib import Path
+from threading import current_thread
+from threading import main_thread
 from threading import Thread
 from typing import Any
 from typing import Callable
 from typing import Dict
 from typing import Optional
 from typing import Protocol
+from typing import Tuple
 from typing import Type
 from typing import TypeVar
 from typing import Union
@@ -41,12 +46,32 @@ from pythia.utils.gst import gst_init
 from pythia.utils.gst import PadDirection
 from pythia.utils.message_handlers import on_message_eos
 from pythia.utils.message_handlers import on_message_error
+from pythia.utils.message_handlers import on_message_latency
+from pythia.utils.message_handlers import on_message_qos
 
 logger = getLogger(__name__)
 
 GST_DEBUG_DUMP_DOT_DIR = os.environ.get("GST_DEBUG_DUMP_DOT_DIR", None)
 
 
+@lru_cache(maxsize=32)
+def _read_pipeline_template(
+    pipeline_file: Path, mtime_ns: int  # noqa: W0613
+) -> str:
+    """Read a pipeline template, cached until the file is modified.
+
+    Args:
+        pipeline_file: Location of the pipeline template.
+        mtime_ns: modification time of the file, only used as part of
+            the cache key.
+
+    Returns:
+        The file contents.
+
+    """
+    return pipeline_file.read_text(encoding="utf-8")
+
+
 class RunLoop(Protocol):
     """Loop wrapper interface."""
 
@@ -161,6 +186,32 @@ BoundSupportedCb = Union[
 CB = TypeVar("CB", SupportedCb, BoundSupportedCb)
 
 
+@lru_cache(maxsize=None)
+def _message_handler_names(klass: type) -> Tuple[Tuple[str, str], ...]:
+    """Map bus detailed signals to an application class' handlers.
+
+    Args:
+        klass: The application class to inspect.
+
+    Returns:
+        Pairs of (detailed signal, method name), computed once per
+            class.
+
+    """
+    names = []
+    for name in dir(klass):
+        if not name.startswith("on_message"):
+            continue
+        if name.startswith("on_message_"):
+            key = "message::{}".format(  # noqa: C0209
+                name.split("on_message")[1].lstrip("_").replace("_", "-")
+            )
+        else:
+            key = "message"
+        names.append((key, name))
+    return tuple(names)
+
+
 class BaseApplication:
     """Base pythia application to reduce boilerplate.
 
@@ -174,6 +225,8 @@ class BaseApplication:
     """
 
     loop_cls: Type[RunLoop] = BackgroundThreadLoop
+    eos_timeout_sec: int = 5
+    """Seconds to wait for the EOS sent on exit signals before stopping."""
 
     def __init__(self, pipeline: BasePipeline) -> None:
         """Construct an application from a pipeline.
@@ -190,20 +243,14 @@ class BaseApplication:
         )
         self._message_handlers = self._build_message_handlers()
         self.watch_ids: list[int] = []
+        self._exit_requested = False
+        self._eos_timeout_id: Optional[int] = None
 
     def _build_message_handlers(self) -> Dict[str, OnBusMessage]:
-        handlers = {}
-        for name in dir(self):
-            if not name.startswith("on_message"):
-                continue
-            if name.startswith("on_message_"):
-                key = "message::{}".format(  # noqa: C0209
-                    name.split("on_message")[1].lstrip("_").replace("_", "-")
-                )
-            else:
-                key = "message"
-            handlers[key] = getattr(self, name)
-        return handlers
+        return {
+            key: getattr(self, name)
+            for key, name in _message_handler_names(type(self))
+        }
 
     @classmethod
     def from_pipeline_string(
@@ -220,7 +267,8 @@ class BaseApplication:
 
         """
         app = cls(StringPipeline(pipeline))
-        app.inject_probes(extractors or {})
+        if extractors:
+            app.inject_probes(extractors)
         return app
 
     @classmethod
@@ -244,7 +292,10 @@ class BaseApplication:
 
         """
 
-        pipeline = Path(pipeline_file).read_text(encoding="utf-8")
+        pipeline_file = Path(pipeline_file)
+        pipeline = _read_pipeline_template(
+            pipeline_file, pipeline_file.stat().st_mtime_ns
+        )
         pipeline_string = pipeline.format_map(params or {})
         return cls.from_pipeline_string(pipeline_string, *args, **kwargs)
 
@@ -277,8 +328,8 @@ class BaseApplication:
         """
         for element_name, connection in self.pipeline.CONNECTIONS.items():
             element = get_element(self.pipeline.pipeline, element_name)
-            for signal, callback in connection.items():
-                element.connect(signal, callback)
+            for signal_name, callback in connection.items():
+                element.connect(signal_name, callback)
 
         self.connect_bus()
         self.loop = self.loop_cls(loop=loop)
@@ -332,6 +383,9 @@ class BaseApplication:
             RuntimeError: loop is already running.
             RuntimeError: Unable to start pipeline.
 
+        While the loop runs, SIGINT and SIGTERM send an EOS to the
+        pipeline instead of killing it, see :meth:`_on_exit_signal`.
+
         """
         if self.loop:
             raise RuntimeError("Loop already running")
@@ -348,10 +402,67 @@ class BaseApplication:
         self.after_pipeline_start()
 
         self.before_loop_join()
+        self._exit_requested = False
+        previous_handlers = self._install_exit_signal_handlers()
         try:
             loop_.join()
         finally:
+            try:
+                self.stop()
+            finally:
+                self._restore_signal_handlers(previous_handlers)
+
+    def _install_exit_signal_handlers(self) -> Dict[int, Any]:
+        if current_thread() is not main_thread():
+            return {}
+        return {
+            signum: signal.signal(signum, self._on_exit_signal)
+            for signum in (signal.SIGINT, signal.SIGTERM)
+        }
+
+    @staticmethod
+    def _restore_signal_handlers(handlers: Dict[int, Any]) -> None:
+        for signum, handler in handlers.items():
+            # `None` means the handler was not installed from python
+            if handler is not None:
+                signal.signal(signum, handler)
+
+    def _on_exit_signal(self, signum: int, _) -> None:
+        """Send EOS on the first exit signal, stop on the second one.
+
+        The EOS lets muxers and sinks finalize their output, and the
+        application then stops from its 'message::eos' handler. If the
+        application does not handle 'message::eos', it is stopped
+        right away. Otherwise, it is stopped anyway when the EOS is not
+        handled within :attr:`eos_timeout_sec`.
+
+        Args:
+            signum: the received signal number.
+
+        """
+        if "message::eos" not in self._message_handlers:
+            logger.info("Received signal %s, stopping.", signum)
             self.stop()
+            return
+        if self._exit_requested:
+            logger.warning("Received signal %s again, stopping.", signum)
+            self.stop()
+            return
+        self._exit_requested = True
+        logger.info("Received signal %s, sending EOS.", signum)
+        self.pipeline.send_eos()
+        self._eos_timeout_id = GLib.timeout_add_seconds(
+            self.eos_timeout_sec, self._on_eos_timeout
+        )
+
+    def _on_eos_timeout(self) -> bool:
+        self._eos_timeout_id = None
+        logger.warning(
+            "EOS not handled after %s seconds, stopping.",
+            self.eos_timeout_sec,
+        )
+        self.stop()
+        return False
 
     def stop(
         self,
@@ -366,7 +477,11 @@ class BaseApplication:
 
         """
 
+        if self._eos_timeout_id is not None:
+            GLib.source_remove(self._eos_timeout_id)
+            self._eos_timeout_id = None
         self.pipeline.stop()
+        self._close_backends()
         if self.loop is not None:
             try:
                 self.before_loop_quit()
@@ -378,6 +493,13 @@ class BaseApplication:
             finally:
                 self.loop = None
 
+    def _close_backends(self) -> None:
+        for padprobes in self._registered_probes.values():
+            for registered in padprobes.values():
+                for entry in registered:
+                    if entry["backend"] is not None:
+                        entry["backend"].close()
+
     def probe(
         self,
         element_name: str,
@@ -486,44 +608,30 @@ def _get_from_annotations(signature, name) -> Optional[int]:
         return None
 
 
-def _get_probe_batch_meta_idx(signature: inspect.FullArgSpec) -> Optional[int]:
-    batch_meta_strats = [
-        (_get_from_positional_arg_name, "batch_meta"),
-        (_get_from_annotations, "pyds.NvDsBatchMeta"),
-    ]
-    batch_meta_idx = None
-    for strategy, name in batch_meta_strats:
-        batch_meta_idx = strategy(signature, name)
-        if batch_meta_idx is not None:
-            return batch_meta_idx
-    return None
-
-
-def _get_probe_pad_idx(signature: inspect.FullArgSpec) -> Optional[int]:
-    pad_idx_strats = [
-        (_get_from_positional_arg_name, "pad"),
-        (_get_from_positional_arg_name, "gst_pad"),
-        (_get_from_annotations, "Gst.Pad"),
-    ]
-    pad_idx = None
-    for strategy, name in pad_idx_strats:
-        pad_idx = strategy(signature, name)
-        if pad_idx is not None:
-            return pad_idx
-    return None
-
-
-def _get_probe_info_idx(signature: inspect.FullArgSpec) -> Optional[int]:
-    info_idx_strats = [
-        (_get_from_positional_arg_name, "info"),
-        (_get_from_positional_arg_name, "gst_info"),
-        (_get_from_annotations, "Gst.PadProbeInfo"),
-    ]
-    info_idx = None
-    for strategy, name in info_idx_strats:
-        info_idx = strategy(signature, name)
-        if info_idx is not None:
-            return info_idx
+_BATCH_META_STRATS = (
+    (_get_from_positional_arg_name, "batch_meta"),
+    (_get_from_annotations, "pyds.NvDsBatchMeta"),
+)
+_PAD_STRATS = (
+    (_get_from_positional_arg_name, "pad"),
+    (_get_from_positional_arg_name, "gst_pad"),
+    (_get_from_annotations, "Gst.Pad"),
+)
+_INFO_STRATS = (
+    (_get_from_positional_arg_name, "info"),
+    (_get_from_positional_arg_name, "gst_info"),
+    (_get_from_annotations, "Gst.PadProbeInfo"),
+)
+
+
+def _get_probe_arg_idx(
+    signature: inspect.FullArgSpec,
+    strategies: Tuple[Tuple[Callable, str], ...],
+) -> Optional[int]:
+    for strategy, name in strategies:
+        idx = strategy(signature, name)
+        if idx is not None:
+            return idx
     return None
 
 
@@ -545,19 +653,9 @@ def _build_probe(probe, backend_uri: Optional[EventStreamUri] = None):
 
     is_bound = hasattr(probe, "__self__")
 
-    batch_meta_idx = _get_probe_batch_meta_idx(signature)
-    pad_idx = _get_probe_pad_idx(signature)
-    info_idx = _get_probe_info_idx(signature)
-
-    supported = [
-        ["batch_meta"],
-        ["pad", "info"],
-        ["pad", "info", "batch_meta"],
-    ]
-    err_tmp = (
-        f"Unsupported spec {signature.args} for '{probe.__name__}'."
-        f" Muse be one of `{supported}`"
-    )
+    batch_meta_idx = _get_probe_arg_idx(signature, _BATCH_META_STRATS)
+    pad_idx = _get_probe_arg_idx(signature, _PAD_STRATS)
+    info_idx = _get_probe_arg_idx(signature, _INFO_STRATS)
 
     if is_bound:
         pad_idx = (
@@ -575,6 +673,7 @@ def _build_probe(probe, backend_uri: Optional[EventStreamUri] = None):
     if batch_meta_idx == 0 and (pad_idx is None) and (info_idx is None):
         if is_iterator and (backend_uri is not None):
             backend = Backend.from_uri(backend_uri)
+            post_many = backend.post_many
 
             def pythia_iter_probe_batch_meta(
                 _: Gst.Pad, info: Gst.PadProbeInfo
@@ -582,8 +681,9 @@ def _build_probe(probe, backend_uri: Optional[EventStreamUri] = None):
                 batch_meta = info2batchmeta(info)
                 if not batch_meta:
                     return Gst.PadProbeReturn.OK
-                for data in probe(batch_meta):
-                    backend.post(data)
+                events = list(probe(batch_meta))
+                if events:
+                    post_many(events)
                 return Gst.PadProbeReturn.OK
 
             return pythia_iter_probe_batch_meta, backend
@@ -618,7 +718,15 @@ def _build_probe(probe, backend_uri: Optional[EventStreamUri] = None):
 
         return probe, None
 
-    raise ValueError(err_tmp)
+    supported = [
+        ["batch_meta"],
+        ["pad", "info"],
+        ["pad", "info", "batch_meta"],
+    ]
+    raise ValueError(
+        f"Unsupported spec {signature.args} for '{probe.__name__}'."
+        f" Muse be one of `{supported}`"
+    )
 
 
 class Application(BaseApplication):
@@ -626,3 +734,5 @@ class Application(BaseApplication):
 
     on_message_eos = on_message_eos
     on_message_error = on_message_error
+    on_message_latency = on_message_latency
+    on_message_qos = on_message_qos
@@ -5,12 +5,15 @@ Its a typer application mimmicking `gst-launch`.
 """
 from __future__ import annotations
 
+import ast
 import enum
 import re
 import sys
 import traceback
 from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
+from types import ModuleType
 from typing import Any
 from typing import Callable
 from typing import cast
@@ -19,21 +22,16 @@ from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Tuple
+from typing import TYPE_CHECKING
 
 import typer
-from fire import decorators
-from fire.core import _MakeParseFn
 
-from pythia import __version__
-from pythia.applications.command_line import CliApplication
 from pythia.exceptions import InvalidPipelineError
-from pythia.pipelines.base import UNABLE_TO_PLAY_PIPELINE
-from pythia.types import PadDirection
-from pythia.types import Probes
-from pythia.utils.ext import import_from_str
-from pythia.utils.gst import GLib
-from pythia.utils.gst import Gst
-from pythia.utils.gst import gst_init
+from pythia.version import __version__
+
+if TYPE_CHECKING:
+    from pythia.types import PadDirection
+    from pythia.types import Probes
 
 LOOKS_LIKE_JINJA_WARN = (
     "It looks like you're attemplting to use a pipeline using jinja syntax,"
@@ -95,7 +93,7 @@ def pipe_from_file(path: Path) -> str:
     """
     if path == Path("-"):
         return sys.stdin.read()
-    return path.read_text()
+    return path.read_text(encoding="utf-8")
 
 
 def pipe_from_parts(parts: Collection[str]) -> str:
@@ -169,55 +167,88 @@ def define_template(
     raise typer.Abort()
 
 
-def _receive_any_return_kw(*_, **kw):
-    return kw
+CtxRetType = Tuple[List[str], Dict[str, Any]]
 
+FLAG = re.compile(r"^(?:--|-[a-zA-Z])")
+"""Arguments considered flags, ie not positional nor flag values."""
 
-CtxRetType = Tuple[List[str], Dict[str, Any]]
+
+def _parse_flag_value(value: str) -> Any:
+    try:
+        return ast.literal_eval(value)
+    except (ValueError, SyntaxError, MemoryError, RecursionError):
+        return value
 
 
-def parse_arbitrary_argv(
-    component: Callable,
-    args: List[str],
-) -> CtxRetType:
-    """Parse arguments into positional and named according to a function.
+def parse_arbitrary_argv(args: List[str]) -> CtxRetType:
+    """Parse arguments into positional and named.
 
     Args:
-        component: function to supply param spec and metadata.
         args: list of positional arguments to parse.
 
     Returns:
         Positional arguments.
         Named value pairs dictionary extracted from the input arg list.
 
-    Examples:
-        >>> def asdf()
+    Flags can be passed as '--key=value' or '--key value', and their
+    dashes are converted to underscores. A flag followed by another
+    flag, or by nothing, is set to `True`, unless it is prefixed with
+    'no' ('--nokey' or '--no-key'), which sets 'key' to `False`.
+    Values are evaluated as python literals when possible, and kept as
+    strings otherwise. Everything after a bare '--' is positional.
 
-    See Also:
-        :func:`fire.core._Fire` and its call to
-        :func:`fire.core._CallAndUpdateTrace`
+    Examples:
+        >>> parse_arbitrary_argv(["a", "--b=1", "--c", "d", "--e"])
+        (['a'], {'b': 1, 'c': 'd', 'e': True})
+        >>> parse_arbitrary_argv(["--nosync", "--no-qos"])
+        ([], {'sync': False, 'qos': False})
 
     """
-    parse = _MakeParseFn(component, decorators.GetMetadata(component))
-    (parts, kwargs), *_ = parse(args)
+    parts: List[str] = []
+    kwargs: Dict[str, Any] = {}
+    idx = 0
+    while idx < len(args):
+        arg = args[idx]
+        idx += 1
+        if arg == "--":
+            parts.extend(args[idx:])
+            break
+        if not FLAG.match(arg):
+            parts.append(arg)
+            continue
+        key, has_value, value = arg.lstrip("-").partition("=")
+        key = key.replace("-", "_")
+        if has_value:
+            kwargs[key] = _parse_flag_value(value)
+        elif idx == len(args) or FLAG.match(args[idx]):
+            if key.startswith("no") and len(key) > 2:
+                kwargs[key[2:].lstrip("_")] = False
+            else:
+                kwargs[key] = True
+        else:
+            kwargs[key] = _parse_flag_value(args[idx])
+            idx += 1
     return parts, kwargs
 
 
 def _ctx_cb() -> CtxRetType:
-    return parse_arbitrary_argv(_receive_any_return_kw, sys.argv[1:])
+    return parse_arbitrary_argv(sys.argv[1:])
 
 
 Renderer = Callable[[str, Dict[str, Any]], str]
 
+NATIVE_PLACEHOLDER = re.compile(r"(?<=\{).*?(?=\})")
+"""Fields required by a :meth:`str.format` pipeline template."""
+
 
 def _native_renderer(pipeline_template: str, context: dict) -> str:
     ret = pipeline_template
     found = {}
-    for required in re.findall(r"(?<=\{).*?(?=\})", pipeline_template):
-
-        found[required] = context.pop(
-            required, context.pop(required.replace("-", "_"))
-        )
+    for required in set(NATIVE_PLACEHOLDER.findall(pipeline_template)):
+        if required in context:
+            found[required] = context.pop(required)
+        else:
+            found[required] = context.pop(required.replace("-", "_"))
 
     ret = ret.format_map(found)
     return ret
@@ -239,6 +270,15 @@ def _jinja_renderer(pipeline_template: str, context: dict) -> str:
     return jinja_template.render(found)
 
 
+@lru_cache(maxsize=None)
+def _jinja_available() -> bool:
+    try:
+        import jinja2  # noqa: F401,C0415
+    except ImportError:
+        return False
+    return True
+
+
 def choose_renderer(pipeline_template: str) -> Renderer:
     """Decide wether to use jinja or vanilla python template.
 
@@ -254,14 +294,11 @@ def choose_renderer(pipeline_template: str) -> Renderer:
 
     """
     looks_like_jinja = "{{" in pipeline_template
-    try:
-        import jinja2  # noqa: F401
-    except ImportError:
+    if not _jinja_available():
         if looks_like_jinja:
             typer.secho(LOOKS_LIKE_JINJA_WARN, fg="yellow")
         return _native_renderer
-    else:
-        return _jinja_renderer if looks_like_jinja else _native_renderer
+    return _jinja_renderer if looks_like_jinja else _native_renderer
 
 
 def build_pipeline(
@@ -301,6 +338,10 @@ def _validate_pipeline(pipeline_string: str, *, check: bool = True) -> int:
     if not check:
         return 0
 
+    from pythia.utils.gst import GLib  # noqa: C0415
+    from pythia.utils.gst import Gst  # noqa: C0415
+    from pythia.utils.gst import gst_init  # noqa: C0415
+
     gst_init()
 
     try:
@@ -330,14 +371,18 @@ EXTRACTOR_PARSER = (
     r"$"
 )
 
+_EXTRACTOR_RE = re.compile(EXTRACTOR_PARSER, flags=re.MULTILINE)
+
 
 def _validate_extractors(extractor: Optional[List[str]]) -> Probes:
     if not extractor:
         return {}
-    parser_re = re.compile(EXTRACTOR_PARSER, flags=re.MULTILINE)
+    from pythia.utils.ext import import_from_str  # noqa: C0415
+
     probes: Probes = defaultdict(lambda: defaultdict(list))
+    modules: Dict[Tuple[str, str], ModuleType] = {}
     for extractor_string in extractor:
-        match = parser_re.match(extractor_string)
+        match = _EXTRACTOR_RE.match(extractor_string)
         if not match:
             raise ValueError(
                 f"Unable to parse extractor '{extractor_string}'."
@@ -345,13 +390,20 @@ def _validate_extractors(extractor: Optional[List[str]]) -> Probes:
                 "'my_module:my_function@element-name.pad-direction'."
             )
         data = match.groupdict()
+        module_key = (data["module"], data["suffix"] or "")
         try:
-            module = import_from_str(data["module"], suffix=data["suffix"])
-        except ImportError as exc:
-            raise ValueError(
-                f"Unable to import module from extractor '{extractor_string}'."
-                " Make sure it exists, and is importable."
-            ) from exc
+            module = modules[module_key]
+        except KeyError:
+            try:
+                module = modules[module_key] = import_from_str(
+                    data["module"], suffix=data["suffix"]
+                )
+            except ImportError as exc:
+                raise ValueError(
+                    "Unable to import module from extractor"
+                    f" '{extractor_string}'."
+                    " Make sure it exists, and is importable."
+                ) from exc
         try:
             raw_probe = getattr(module, data["probe"])
         except (KeyError, NameError) as exc:
@@ -360,7 +412,7 @@ def _validate_extractors(extractor: Optional[List[str]]) -> Probes:
                 f"'{extractor_string}'."
                 " Make sure the function is available in the it's namespace."
             ) from exc
-        direction = cast(PadDirection, data["direction"])
+        direction = cast("PadDirection", data["direction"])
         probes[data["element"]][direction].append(raw_probe)
     return probes
 
@@ -441,6 +493,10 @@ def main(  # noqa: C0116, R0913
         retcode = _validate_pipeline(pipeline_string, check=check)
         raise typer.Exit(retcode)
 
+    from pythia.applications import command_line  # noqa: C0415
+    from pythia.pipelines.base import UNABLE_TO_PLAY_PIPELINE  # noqa: C0415
+    from pythia.utils.gst import gst_init  # noqa: C0415
+
     try:
         extractors = _validate_extractors(extractor)
     except (ImportError, ValueError, AttributeError) as exc:
@@ -448,7 +504,9 @@ def main(  # noqa: C0116, R0913
 
     try:
         gst_init()
-        run = CliApplication.from_pipeline_string(pipeline_string, extractors)
+        run = command_line.CliApplication.from_pipeline_string(
+            pipeline_string, extractors
+        )
     except NameError as exc:
         raise Exit.EXTRACTION_NOT_BOUND(exc) from exc
     except InvalidPipelineError as exc:
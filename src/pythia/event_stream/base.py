@@ -6,6 +6,7 @@ import importlib
 import re
 from typing import Any
 from typing import Dict
+from typing import Iterable
 from typing import Tuple
 from typing import Type
 from urllib.parse import parse_qs
@@ -106,10 +107,31 @@ class Backend(abc.ABC):
         Args:
             data: the data to send.
 
-        This method gets called once for each element yielded from the
-        buffer probe.
+        By default, this method gets called once for each element
+        yielded from the buffer probe, see :meth:`post_many`.
 
         Any kind of batching should be implemented here and coordinated
         with the respective buffer probe.
 
         """
+
+    def post_many(self, batch: Iterable) -> None:
+        """Send every packet of data yielded from a single probe call.
+
+        Args:
+            batch: the data to send, one element per packet.
+
+        Defaults to calling :meth:`post` for each element. Backends
+        which can send several packets at once should override this.
+
+        """
+        post = self.post
+        for data in batch:
+            post(data)
+
+    def close(self) -> None:
+        """Release the resources held by the backend.
+
+        Called when the application stops. Does nothing by default.
+
+        """
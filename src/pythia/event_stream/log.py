@@ -1,42 +1,85 @@
-"""Memory-backed event stream storage."""
+"""Log-backed event stream storage."""
 
 from __future__ import annotations
 
+import json
+import sys
 from pathlib import Path
+from typing import Iterable
+from typing import TextIO
 
-from pythia.applications.annotation import _DumpLogger
-from pythia.applications.annotation import _make_logger
 from pythia.event_stream.base import Backend as Base
 
 
+def _open_stream(stream: str) -> TextIO:
+    if stream in ("stdout", "stderr"):
+        return getattr(sys, stream)
+    logfile = Path(stream)
+    if logfile.is_dir():
+        logfile = logfile / "detections.jsonl"
+        logfile.unlink(missing_ok=True)
+    return logfile.open("a", buffering=1, encoding="utf-8")
+
+
 class Backend(Base):
-    """Simple event stream client to dump incoming data using logs."""
+    """Simple event stream client to dump incoming data as json lines."""
 
-    _logger: _DumpLogger | None = None
+    _file: TextIO | None = None
 
     @property
-    def logger(self) -> _DumpLogger:
-        """Internal logger lazy-loader.
+    def file(self) -> TextIO:
+        """Internal output stream lazy-loader.
 
         Returns:
-            Initialized logger.
+            Opened, line-buffered, text stream.
 
         """
-        if self._logger is None:
+        if self._file is None:
             self.connect()
-        return self._logger  # type: ignore
+        return self._file  # type: ignore
 
     def connect(self) -> None:
-        """Fetch stream-specific deque from global container."""
-        if self.stream not in ("stdout", "stderr"):
-            self.stream = Path(self.stream)
-        self._logger = _make_logger(type(self).__qualname__, self.stream)
+        """Open the stream: 'stdout', 'stderr', or a file path.
+
+        If the stream is a directory, the data is written to a fresh
+        `detections.jsonl` file inside it.
+
+        """
+        self._file = _open_stream(self.stream)
 
     def post(self, data) -> None:
-        """Append an element into the deque.
+        """Write an element as a json line.
+
+        Args:
+            data: the data to write. Must be json-serializable.
+
+        The stream is flushed after every write, so consumers reading
+        from a pipe receive each event as soon as it is posted.
+
+        """
+        file = self.file
+        file.write(json.dumps(data) + "\n")
+        file.flush()
+
+    def post_many(self, batch: Iterable) -> None:
+        """Write every element in the batch, as json lines, at once.
 
         Args:
-            data: the data to append. Can be any python object.
+            batch: the data to write. Must be json-serializable.
 
         """
-        self.logger.json(data)
+        lines = [json.dumps(data) for data in batch]
+        if lines:
+            lines.append("")
+            file = self.file
+            file.write("\n".join(lines))
+            file.flush()
+
+    def close(self) -> None:
+        """Close the output file, leaving 'stdout' and 'stderr' open."""
+        if self._file is not None and self._file not in (
+            sys.stdout,
+            sys.stderr,
+        ):
+            self._file.close()
+        self._file = None
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections import deque
 from typing import Callable
+from typing import Iterable
 
 from pythia.event_stream.base import Backend as Base
 
@@ -51,3 +52,12 @@ class Backend(Base):
 
         """
         self.deque.append(data)
+
+    def post_many(self, batch: Iterable) -> None:
+        """Extend the deque with every element in the batch.
+
+        Args:
+            batch: the data to append. Can be any python objects.
+
+        """
+        self.deque.extend(batch)
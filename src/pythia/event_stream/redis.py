@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from typing import Iterable
 
 from redis import Redis
 
@@ -45,3 +46,15 @@ class Backend(Base):
         """
 
         self.client.xadd(self.stream, fields={"data": json.dumps(data)})
+
+    def post_many(self, batch: Iterable) -> None:
+        """Send the batch in a single roundtrip using a redis pipeline.
+
+        Args:
+            batch: the data to append. Can be any python objects.
+
+        """
+        pipe = self.client.pipeline(transaction=False)
+        for data in batch:
+            pipe.xadd(self.stream, fields={"data": json.dumps(data)})
+        pipe.execute()
@@ -59,26 +59,25 @@ def glist_iter(
         The Object instantiated when calling the `cast` function.
 
     """
-    while container_list is not None:
-        try:
-            meta = klass.cast(container_list.data)
-        except StopIteration:
-            break
-        yield meta
-        try:
+    cast = klass.cast
+    try:
+        while container_list is not None:
+            yield cast(container_list.data)
             container_list = container_list.next
-        except StopIteration:
-            break
+    except StopIteration:
+        pass
 
 
 def _iter_user_meta(
     container_list: pyds.GList,
     kind: Type[SupportedUserMeta],
 ) -> Iterator:
+    condition = kind.condition
+    cast = kind.klass.cast
     for meta in glist_iter(container_list, pyds.NvDsUserMeta):
-        if kind.condition(meta):
+        if condition(meta):
             try:
-                yield kind.klass.cast(meta.user_meta_data)
+                yield cast(meta.user_meta_data)
             except StopIteration:
                 break
 
@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import configparser
 import json
+import sys
 from dataclasses import dataclass
 from dataclasses import field
 from pathlib import Path
@@ -19,6 +20,7 @@ from textwrap import dedent as _
 from typing import Collection
 from typing import Dict
 from typing import Optional
+from typing import Tuple
 from typing import Type
 from typing import TypeVar
 
@@ -26,12 +28,90 @@ from pythia.types import Con
 from pythia.types import HasConnections
 from pythia.utils.ext import not_empty
 from pythia.utils.ext import not_none
+from pythia.utils.ext import resolve_path
 from pythia.utils.gst import Gst
 
 IE = TypeVar("IE", bound="InferenceEngine")
 T = TypeVar("T", bound="Tracker")
 A = TypeVar("A", bound="Analytics")
 
+_CONFIGS: Dict[Path, Tuple[int, configparser.ConfigParser]] = {}
+"""Parsed config files, along with their modification time."""
+
+
+def _intern_option(optionstr: str) -> str:
+    """Lowercase option names, as configparser does, and intern them.
+
+    Args:
+        optionstr: The option name, as read from the file or requested.
+
+    Returns:
+        The normalized, interned, option name.
+
+    """
+    return sys.intern(optionstr.lower())
+
+
+def _read_config(config_file: Path) -> configparser.ConfigParser:
+    """Parse a deepstream ini config file, reusing unmodified ones.
+
+    Args:
+        config_file: The configuration file to parse.
+
+    Returns:
+        The parsed configuration. It is shared between callers, so it
+            must not be modified. Missing files result in an empty
+            configuration, as with :meth:`configparser.ConfigParser.read`.
+
+    """
+    try:
+        mtime = config_file.stat().st_mtime_ns
+    except FileNotFoundError:
+        return configparser.ConfigParser(interpolation=None)
+    try:
+        cached_mtime, config = _CONFIGS[config_file]
+    except KeyError:
+        pass
+    else:
+        if cached_mtime == mtime:
+            return config
+    config = configparser.ConfigParser(interpolation=None)
+    config.optionxform = _intern_option  # type: ignore[assignment]
+    config.read_string(
+        config_file.read_text(encoding="utf-8"), source=str(config_file)
+    )
+    _CONFIGS[config_file] = (mtime, config)
+    return config
+
+
+def _element_properties(element: Gst.Element) -> Dict[str, str]:
+    """Render a gstreamer element's properties as `gst-launch` values.
+
+    Args:
+        element: The element to read the properties from.
+
+    Returns:
+        Mapping of property names to their string values, as they
+            would be written in a `gst-launch`-like pipeline.
+
+    """
+    skip = ("parent",)
+    props = {}
+    for prop in element.list_properties():
+        name = prop.name
+        if name in skip:
+            continue
+
+        raw = element.get_property(name)
+        try:
+            value = raw.value_nick  # enums
+        except AttributeError:
+            value = str(raw)
+            if isinstance(raw, bool):
+                value = value.lower()  # False -> false
+        props[name] = value
+    return props
+
 
 @dataclass
 class InferenceEngine(HasConnections):
@@ -229,7 +309,7 @@ class InferenceEngine(HasConnections):
             FileNotFoundError: empty folder received.
 
         """
-        folder = Path(folder).resolve()
+        folder = resolve_path(folder)
         if not folder.exists():
             raise FileNotFoundError(f"No directory not found at {folder}.")
 
@@ -256,23 +336,9 @@ class InferenceEngine(HasConnections):
             The instantiated nvinfer wrapper.
 
         """
-        skip = ("parent",)
-        props = {}
-        for prop in element.list_properties():
-            name = prop.name
-            if name in skip:
-                continue
+        props = _element_properties(element)
 
-            raw = element.get_property(name)
-            try:
-                value = raw.value_nick  # enums
-            except AttributeError:
-                value = str(raw)
-                if isinstance(raw, bool):
-                    value = value.lower()  # False -> false
-            props[name] = value
-
-        config_file = Path(props.pop("config-file-path")).resolve()
+        config_file = resolve_path(props.pop("config-file-path"))
         return cls(
             config_file=config_file,
             labels_file=not_none(
@@ -330,16 +396,18 @@ class InferenceEngine(HasConnections):
                 continue
             value_path = Path(value)
             if not value_path.is_absolute():
-                value_path = value_path.relative_to(config_file).resolve()
+                value_path = (config_file.parent / value_path).resolve()
             return value_path
 
         # extract from nvinfer's config file
         if not config_file.exists():
             raise FileNotFoundError(config_file)
-        config = configparser.ConfigParser()
-        config.read(str(config_file))
+        try:
+            section = _read_config(config_file)["property"]
+        except KeyError:
+            return None
         for prop_name in property_names:
-            value = config["property"].get(prop_name, None)
+            value = section.get(prop_name, None)
             if value is None:
                 continue
             value_path = Path(value)
@@ -357,7 +425,7 @@ class Tracker(HasConnections):
     config_file: Path
     low_level_library: Path = Path(
         "/opt/nvidia/deepstream/deepstream/lib/libnvds_nvmultiobjecttracker.so"
-    ).resolve()
+    )
     _string: Optional[str] = None
     _default_props: Dict[str, str] = field(default_factory=dict)
     CONNECTIONS: Con = field(default_factory=dict)  # noqa: C0103
@@ -383,7 +451,7 @@ class Tracker(HasConnections):
             FileNotFoundError: Tracker config file does not exist.
 
         """
-        config_file = Path(config_file).resolve()
+        config_file = resolve_path(config_file)
         if not config_file.exists():
             raise FileNotFoundError(
                 f"No Tracker configuration file found at {config_file}."
@@ -404,21 +472,7 @@ class Tracker(HasConnections):
             The instantiated nvtracker wrapper.
 
         """
-        skip = ("parent",)
-        props = {}
-        for prop in element.list_properties():
-            name = prop.name
-            if name in skip:
-                continue
-
-            raw = element.get_property(name)
-            try:
-                value = raw.value_nick  # enums
-            except AttributeError:
-                value = str(raw)
-                if isinstance(raw, bool):
-                    value = value.lower()  # False -> false
-            props[name] = value
+        props = _element_properties(element)
 
         return cls(
             config_file=props.pop("ll-config-file"),
@@ -509,8 +563,7 @@ class Analytics(HasConnections):
                 direction andata.
 
         """
-        config = configparser.ConfigParser()
-        config.read(str(self.config_file))
+        config = _read_config(Path(self.config_file))
         for section_name in config.sections():
             if any(
                 section_name.startswith(pattern)
@@ -538,7 +591,7 @@ class Analytics(HasConnections):
                 property is not found.
 
         """
-        config_file = Path(config_file).resolve()
+        config_file = resolve_path(config_file)
         if not config_file.exists():
             raise FileNotFoundError(
                 f"No Analytics configuration file found at {config_file}."
@@ -556,21 +609,7 @@ class Analytics(HasConnections):
             The instantiated nvdsanalytics wrapper.
 
         """
-        skip = ("parent",)
-        props = {}
-        for prop in element.list_properties():
-            name = prop.name
-            if name in skip:
-                continue
-
-            raw = element.get_property(name)
-            try:
-                value = raw.value_nick  # enums
-            except AttributeError:
-                value = str(raw)
-                if isinstance(raw, bool):
-                    value = value.lower()  # False -> false
-            props[name] = value
+        props = _element_properties(element)
 
         return cls(
             config_file=props.pop("config-file"),
@@ -44,9 +44,7 @@ from pythia.utils.ext import get_arch
 from pythia.utils.gst import GLib
 from pythia.utils.gst import Gst
 from pythia.utils.gst import gst_init
-from pythia.utils.str2pythia import find_analytics
-from pythia.utils.str2pythia import find_models
-from pythia.utils.str2pythia import find_tracker
+from pythia.utils.str2pythia import find_wrappers
 
 PSB = Union["PythiaTestSource", "PythiaSource", "PythiaMultiSource"]
 PS = Union[
@@ -291,29 +289,18 @@ class PythiaMultiSource(PythiaSourceBase):
 
 
 class PythiaTestSource(PythiaSourceBase):
-    """videotestsrc wrapper building block."""
+    """videotestsrc wrapper building block.
 
-    @staticmethod
-    def pop_pythia_args_from_uris(
-        uris: Tuple[SourceUri, ...],
-    ) -> Tuple[dict, List[SourceUri]]:
-        """Extract muxer width and height.
-
-        Args:
-            uris: input uris to filter
-
-        Returns:
-            extracted: dictionary containing popped params.
-            list containing the single uri wihtout its pythia query params.
+    Examples:
+        >>> uris = ["test://?muxer_width=320&muxer_height=240"]
+        >>> PythiaTestSource.pop_pythia_args_from_uris(uris)
+        ({'muxer_width': 320, 'muxer_height': 240}, ['test:'])
 
-        Examples:
-            >>> uris = ["test://?muxer_width=320&muxer_height=240"]
-            >>> PythiaTestSource.pop_pythia_args_from_uris(uris)
-            ({'muxer_width': 320, 'muxer_height': 240}, ['test:'])
+    """
 
-        """
-        extracted, clean_uri = clean_single_uri(uris[0])
-        return extracted, [clean_uri]
+    pop_pythia_args_from_uris = staticmethod(
+        PythiaSource.pop_pythia_args_from_uris
+    )
 
     def gst(self) -> str:
         """Render from single videotestsrc up to nvmuxer.
@@ -508,7 +495,7 @@ class PythiaLiveSink(PythiaSink):
         """
         super().__init__(uri)
         self.arch = arch or get_arch()
-        self.transform = "! nvegltransform" if get_arch() == "aarch64" else ""
+        self.transform = "! nvegltransform" if self.arch == "aarch64" else ""
 
     def gst(self) -> str:
         """Render from nvvideoconvert to nveglglessink.
@@ -635,8 +622,14 @@ class BasePipeline(HasConnections, abc.ABC):
         return result
 
     def stop(self) -> None:
-        """Set the pipeline to null state."""
-        self.pipeline.set_state(Gst.State.NULL)
+        """Set the pipeline to null state.
+
+        Does nothing if the pipeline was never instantiated.
+
+        """
+        if self._pipeline is None:
+            return
+        self._pipeline.set_state(Gst.State.NULL)
 
     def send_eos(self) -> None:
         """Send a gstreamer 'end of stream' signal."""
@@ -794,9 +787,9 @@ class StringPipeline(BasePipeline):
             raise InvalidPipelineError(
                 f"Unable to parse pipeline:\n```gst\n{pipeline_string}\n```"
             ) from exc
-        self.models = find_models(self.pipeline)
-        self.analytics = find_analytics(self.pipeline)
-        self.tracker = find_tracker(self.pipeline)
+        self.models, self.analytics, self.tracker = find_wrappers(
+            self.pipeline
+        )
 
     def gst(self) -> str:
         return self.pipeline_string
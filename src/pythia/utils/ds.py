@@ -1,6 +1,7 @@
 """Deepstream interface, utilities and customization."""
 from __future__ import annotations
 
+from logging import getLogger
 from typing import Any
 from typing import Callable
 from typing import ClassVar
@@ -12,6 +13,10 @@ import pyds
 from pythia.types import PydsClass
 from pythia.utils.gst import Gst
 
+logger = getLogger(__name__)
+
+_gst_buffer_get_nvds_batch_meta = pyds.gst_buffer_get_nvds_batch_meta
+
 
 def buf2batchmeta(gst_buffer: Gst.Buffer) -> pyds.NvDsBatchMeta:
     """Get batch metadata from gstreamer buffer.
@@ -26,7 +31,7 @@ def buf2batchmeta(gst_buffer: Gst.Buffer) -> pyds.NvDsBatchMeta:
         :func:`pyds.gst_buffer_get_nvds_batch_meta`
 
     """
-    return pyds.gst_buffer_get_nvds_batch_meta(hash(gst_buffer))
+    return _gst_buffer_get_nvds_batch_meta(hash(gst_buffer))
 
 
 def info2batchmeta(info: Gst.PadProbeInfo) -> pyds.NvDsBatchMeta | None:
@@ -44,21 +49,28 @@ def info2batchmeta(info: Gst.PadProbeInfo) -> pyds.NvDsBatchMeta | None:
     """
     gst_buffer = info.get_buffer()
     if not gst_buffer:
-        print("Unable to get GstBuffer ")
+        logger.warning("Unable to get GstBuffer")
         return None
     return buf2batchmeta(gst_buffer)
 
 
+ANALYTICS_OBJ_META_TYPE = pyds.nvds_get_user_meta_type(
+    "NVIDIA.DSANALYTICSOBJ.USER_META"
+)
+"""User meta type for per-object `nvdsanalytics` metadata."""
+
+ANALYTICS_FRAME_META_TYPE = pyds.nvds_get_user_meta_type(
+    "NVIDIA.DSANALYTICSFRAME.USER_META"
+)
+"""User meta type for per-frame `nvdsanalytics` metadata."""
+
+
 def _is_analytics_meta(user_meta: pyds.NvDsUserMeta) -> bool:
-    return user_meta.base_meta.meta_type == pyds.nvds_get_user_meta_type(
-        "NVIDIA.DSANALYTICSOBJ.USER_META"
-    )
+    return user_meta.base_meta.meta_type == ANALYTICS_OBJ_META_TYPE
 
 
 def _is_frameanalytics_meta(user_meta: pyds.NvDsUserMeta) -> bool:
-    return user_meta.base_meta.meta_type == pyds.nvds_get_user_meta_type(
-        "NVIDIA.DSANALYTICSFRAME.USER_META"
-    )
+    return user_meta.base_meta.meta_type == ANALYTICS_FRAME_META_TYPE
 
 
 def _is_segmentation_meta(user_meta: pyds.NvDsUserMeta) -> bool:
@@ -68,6 +68,24 @@ def get_arch() -> str:
     return platform.uname()[4]
 
 
+def resolve_path(path: str | Path) -> Path:
+    """Make a path absolute, only resolving it when relative.
+
+    Args:
+        path: The path to make absolute.
+
+    Returns:
+        The received path if already absolute, otherwise resolved
+            against the current working directory.
+
+    Absolute paths are returned as-is to avoid the filesystem lookups
+    performed by :meth:`pathlib.Path.resolve`.
+
+    """
+    path = Path(path)
+    return path if path.is_absolute() else path.resolve()
+
+
 def import_from_path(name: str, path: str | Path) -> ModuleType:
     """Import a module from a filepath.
 
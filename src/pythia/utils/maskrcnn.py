@@ -10,6 +10,7 @@ Author: <Pablo Woolvett pablowoolvett@gmail.com>
 
 """
 
+import math
 from typing import List
 from typing import Tuple
 from typing import TypedDict
@@ -187,13 +188,13 @@ def extract_maskrcnn_mask(obj_meta: pyds.NvDsObjectMeta) -> np.ndarray:
         `resize_mask_vec` for the internal implementation.
 
     """
-    rect_height = int(np.ceil(obj_meta.rect_params.height))
-    rect_width = int(np.ceil(obj_meta.rect_params.width))
+    rect_params = obj_meta.rect_params
+    mask_params = obj_meta.mask_params
     return resize_mask_vec(
-        obj_meta.mask_params.data,
-        (obj_meta.mask_params.height, obj_meta.mask_params.width),
-        (rect_height, rect_width),
-        obj_meta.mask_params.threshold,
+        mask_params.data,
+        (mask_params.height, mask_params.width),
+        (math.ceil(rect_params.height), math.ceil(rect_params.width)),
+        mask_params.threshold,
     )
 
 
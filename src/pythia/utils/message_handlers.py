@@ -1,5 +1,9 @@
 """Common gstreamer pipeline bus message handlers."""
 
+from logging import DEBUG
+from logging import getLogger
+from typing import Any
+from typing import Optional
 from typing import Protocol
 from typing import Tuple
 
@@ -8,6 +12,8 @@ from pythia.utils.gst import Gst
 
 GOT_EOS_FROM = "Got EOS from"
 
+logger = getLogger(__name__)
+
 
 class Stoppable(Protocol):  # noqa: R0903
     """Interface for classes whihc implement the stop method.
@@ -20,6 +26,16 @@ class Stoppable(Protocol):  # noqa: R0903
         ...
 
 
+class HasPipeline(Protocol):  # noqa: R0903
+    """Interface for classes which hold a pythia pipeline.
+
+    Mainly aimed at (but not restricted to) pythia apps.
+
+    """
+
+    pipeline: Any
+
+
 def on_message_error(
     self: Stoppable,  # noqa: W0613
     bus: Gst.Bus,  # noqa: W0613
@@ -83,3 +99,52 @@ def on_message_eos(
     """
     print(f"{GOT_EOS_FROM} {element_repr(message.src)}")
     self.stop()
+
+
+def on_message_latency(
+    self: HasPipeline, bus: Gst.Bus, message: Gst.Message  # noqa: W0613
+) -> bool:
+    """Redistribute the pipeline latency when an element requests it.
+
+    Elements post a latency message when their latency changes, eg
+    live sources or queues. Without recalculating it, sinks keep
+    synchronizing against a stale value and may drop or delay frames.
+
+    Args:
+        self: An instance holding the pythia pipeline.
+        bus: The application's pipeline's bus.
+        message: The gstreamer latency message.
+
+    Returns:
+        Whether the latency could be recalculated.
+
+    """
+    return self.pipeline.pipeline.recalculate_latency()
+
+
+def on_message_qos(
+    self: Stoppable, bus: Gst.Bus, message: Gst.Message  # noqa: W0613
+) -> Optional[Tuple[int, int]]:
+    """Report frames dropped by an element for quality of service.
+
+    Args:
+        self: A stoppable instance.
+        bus: The application's pipeline's bus.
+        message: The gstreamer qos message.
+
+    Returns:
+        Processed and dropped buffer counts, as reported by the
+            element. `None` when debug logging is disabled, as the
+            message is not parsed then.
+
+    """
+    if not logger.isEnabledFor(DEBUG):
+        return None
+    _, processed, dropped = message.parse_qos_stats()
+    logger.debug(
+        "QOS@%s: processed=%s, dropped=%s",
+        message.src.get_name(),
+        processed,
+        dropped,
+    )
+    return processed, dropped
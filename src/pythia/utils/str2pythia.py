@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from typing import List
+from typing import Tuple
+
 from pythia.models.base import Analytics
 from pythia.models.base import InferenceEngine
 from pythia.models.base import Tracker
@@ -99,3 +102,30 @@ def find_tracker(pipeline: Gst.Pipeline) -> Tracker | None:
             return Tracker.from_element(element)
 
     return None
+
+
+def find_wrappers(
+    pipeline: Gst.Pipeline,
+) -> Tuple[List[InferenceEngine], Analytics | None, Tracker | None]:
+    """Extract models, analytics and tracker in a single pass.
+
+    Args:
+        pipeline: The root bin where to look for the elements.
+
+    Returns:
+        All the `nvinfer` wrapped as :class:`InferenceEngine`, and the
+            first `nvdsanalytics` and `nvtracker` found, wrapped as
+            :class:`Analytics` and :class:`Tracker`, respectively.
+
+    """
+    models = []
+    analytics = None
+    tracker = None
+    for element in gst_iter(pipeline.iterate_elements()):
+        if is_inference(element):
+            models.append(InferenceEngine.from_element(element))
+        elif analytics is None and is_analytics(element):
+            analytics = Analytics.from_element(element)
+        elif tracker is None and is_tracker(element):
+            tracker = Tracker.from_element(element)
+    return models, analytics, tracker
@@ -1,3 +0,0 @@
-from typing import Callable
-
-def GetMetadata(fn: Callable) -> dict: ...
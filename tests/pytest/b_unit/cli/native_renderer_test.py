@@ -0,0 +1,21 @@
+"""Verify cli native pipeline template rendering."""
+from pythia.cli.app import _native_renderer
+
+
+def test_native_renderer_repeated_placeholder() -> None:
+    """A placeholder used several times is rendered everywhere."""
+    rendered = _native_renderer(
+        "videotestsrc num-buffers={n} ! identity eos-after={n} ! fakesink",
+        {"n": 5},
+    )
+    assert rendered == (
+        "videotestsrc num-buffers=5 ! identity eos-after=5 ! fakesink"
+    )
+
+
+def test_native_renderer_dashed_placeholder() -> None:
+    """Dashed placeholders accept both dashed and underscored keys."""
+    template = "videotestsrc num-buffers={num-buffers} ! fakesink"
+    expected = "videotestsrc num-buffers=5 ! fakesink"
+    assert _native_renderer(template, {"num-buffers": 5}) == expected
+    assert _native_renderer(template, {"num_buffers": 5}) == expected
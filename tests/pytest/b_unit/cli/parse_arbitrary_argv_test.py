@@ -0,0 +1,34 @@
+"""Verify cli arbitrary keyword arguments parsing."""
+import pytest
+
+from pythia.cli.app import parse_arbitrary_argv
+
+TEST_ARGV = {
+    "positional": (
+        ["videotestsrc", "!", "fakesink"],
+        (["videotestsrc", "!", "fakesink"], {}),
+    ),
+    "equals": (["--num-buffers=5"], ([], {"num_buffers": 5})),
+    "space": (["--sink", "fakesink"], ([], {"sink": "fakesink"})),
+    "bool": (["--sync", "--n=1"], ([], {"sync": True, "n": 1})),
+    "trailing_bool": (["a", "--sync"], (["a"], {"sync": True})),
+    "no_prefix": (["--nosync", "--n=1"], ([], {"sync": False, "n": 1})),
+    "no_dash_prefix": (["a", "--no-sync"], (["a"], {"sync": False})),
+    "no_with_value": (["--nodes", "3"], ([], {"nodes": 3})),
+    "short": (["-p", "pipeline.gst"], ([], {"p": "pipeline.gst"})),
+    "separator": (["--n=1", "--", "--x"], (["--x"], {"n": 1})),
+}
+
+
+@pytest.mark.parametrize(
+    "argv,expected", TEST_ARGV.values(), ids=TEST_ARGV.keys()
+)
+def test_parse_arbitrary_argv(argv, expected) -> None:
+    """Check positional and named arguments are split from argv.
+
+    Args:
+        argv: pytest parametrized arg - from :obj:`TEST_ARGV`.
+        expected: pytest parametrized arg - from :obj:`TEST_ARGV`.
+
+    """
+    assert parse_arbitrary_argv(argv) == expected